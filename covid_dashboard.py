@@ -14,7 +14,7 @@ Key Features:
 
 To run this application:
 1. Save this file as 'covid_dashboard.py'
-2. Install requirements: pip install streamlit plotly pandas numpy
+2. Install requirements: pip install streamlit plotly pandas numpy pyarrow polars
 3. Run: streamlit run covid_dashboard.py
 
 Author: Senior Data Scientist
@@ -23,14 +23,28 @@ Date: 2025
 
 import streamlit as st
 import pandas as pd
+import polars as pl
 import numpy as np
 import plotly.express as px
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pacsv
+import io
 from datetime import datetime, timedelta, date
+from pathlib import Path
 import warnings
 warnings.filterwarnings('ignore')
 
+# Numba is optional - when present, the wave-synthesis kernel below is
+# JIT-compiled and parallelized; otherwise a vectorized NumPy path is used
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
 # =============================================================================
 # PAGE CONFIGURATION AND SETUP
 # =============================================================================
@@ -43,8 +57,11 @@ st.set_page_config(
     initial_sidebar_state="expanded"  # Start with sidebar open
 )
 
-# Custom CSS for professional styling
-st.markdown("""
+# Custom CSS for professional styling - wrapped in a cache_resource one-shot
+# so reruns replay the cached element instead of reserializing the HTML block
+@st.cache_resource
+def _inject_css():
+    st.markdown("""
 <style>
     /* Main dashboard styling */
     .main-header {
@@ -76,21 +93,91 @@ st.markdown("""
     }
 </style>
 """, unsafe_allow_html=True)
+    return True
+
+_inject_css()
 
 # =============================================================================
 # DATA LOADING AND CACHING
 # =============================================================================
 
-@st.cache_data(ttl=3600)  # Cache data for 1 hour to improve performance
+# Local Parquet copy of the generated dataset - lets app restarts skip the
+# synthesis entirely and read a compressed columnar file instead
+DATA_CACHE_PATH = Path("covid_cache.parquet")
+
+# NOTE: the master frame is cached with st.cache_resource, which hands every
+# caller the *same* object instead of a defensive copy. Treat it as strictly
+# read-only: all mutation happens on the filtered copies that filter_data
+# returns, never on this frame.
+@st.cache_resource(ttl=3600)  # Cache for 1 hour; Parquet file covers restarts
 def load_covid_data():
     """
     Load and prepare COVID-19 data with caching for performance.
     In a real application, this would load from the Our World in Data CSV.
     For demonstration, we'll create comprehensive sample data.
+
+    The frame is persisted to a local Parquet file on first build, so cold
+    starts (new container, restarted worker) load via Arrow's columnar
+    reader instead of regenerating the data.
     """
-    
-    # Create comprehensive sample dataset with all required fields
-    np.random.seed(42)  # For reproducible random data
+    if DATA_CACHE_PATH.exists():
+        return pd.read_parquet(DATA_CACHE_PATH, engine="pyarrow")
+
+    df = _build_sample_data()
+    df.to_parquet(DATA_CACHE_PATH, engine="pyarrow", compression="zstd")
+    return df
+
+def _safe_ratio(numerator, denominator, scale=100.0):
+    """
+    Elementwise numerator / denominator * scale, NaN where the denominator
+    is zero. A single fused np.divide pass with a where-mask - no
+    replace(0, nan) rewrite of the denominator column and no intermediate
+    Series allocations.
+    """
+    out = np.full(len(numerator), np.nan, dtype=np.float32)
+    np.divide(numerator, denominator, out=out, where=(denominator != 0))
+    out *= scale
+    return out
+
+if NUMBA_AVAILABLE:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _synthesize_total_cases(daily_step, populations):
+        """
+        JIT-compiled wave model: capped linear growth plus three sine waves.
+        parallel=True spreads countries across cores; cache=True persists
+        the compiled binary so only the first cold start pays compile time.
+        """
+        n_countries, n_days = daily_step.shape
+        out = np.empty((n_countries, n_days), np.int64)
+        for c in prange(n_countries):
+            cap = populations[c] * 0.3
+            for j in range(n_days):
+                base = min(j * daily_step[c, j], cap)
+                wave = base * (0.3 * np.sin(j / 100.0) +
+                               0.2 * np.sin(j / 200.0) +
+                               0.1 * np.sin(j / 300.0))
+                total = np.int64(base + wave)
+                out[c, j] = total if total > 0 else 0
+        return out
+else:
+    def _synthesize_total_cases(daily_step, populations):
+        """Vectorized NumPy fallback implementing the same wave model."""
+        n_days = daily_step.shape[1]
+        days_since_start = np.arange(n_days)
+        base_cases = np.minimum(days_since_start * daily_step,
+                                populations[:, None] * 0.3)
+        waves = base_cases * (0.3 * np.sin(days_since_start / 100) +
+                              0.2 * np.sin(days_since_start / 200) +
+                              0.1 * np.sin(days_since_start / 300))
+        return np.maximum(0, (base_cases + waves).astype(np.int64))
+
+def _build_sample_data():
+    """Generate the synthetic multi-country dataset used by the dashboard."""
+
+    # Create comprehensive sample dataset with all required fields.
+    # default_rng (PCG64) is both faster than the legacy Mersenne Twister
+    # for bulk draws and keeps the data reproducible from one seed.
+    rng = np.random.default_rng(42)
     
     countries = [
         'United States', 'United Kingdom', 'Germany', 'France', 'Italy', 
@@ -115,80 +202,101 @@ def load_covid_data():
     # Generate 2+ years of daily data
     date_range = pd.date_range(start='2020-01-01', end='2023-12-31', freq='D')
     
-    all_data = []
-    
-    for i, country in enumerate(countries):
-        country_population = np.random.randint(10_000_000, 350_000_000)
-        
-        for j, current_date in enumerate(date_range):
-            # Create realistic progression patterns
-            days_since_start = j
-            
-            # Simulate realistic COVID progression with waves
-            base_cases = min(days_since_start * np.random.randint(50, 500), 
-                           country_population * 0.3)
-            
-            # Add wave patterns using sine waves with different periods
-            wave1 = np.sin(days_since_start / 100) * base_cases * 0.3
-            wave2 = np.sin(days_since_start / 200) * base_cases * 0.2
-            wave3 = np.sin(days_since_start / 300) * base_cases * 0.1
-            
-            total_cases = max(0, int(base_cases + wave1 + wave2 + wave3))
-            
-            # Calculate other metrics based on total cases
-            total_deaths = int(total_cases * np.random.uniform(0.01, 0.05))
-            new_cases = max(0, int(total_cases * np.random.uniform(0.001, 0.02)))
-            new_deaths = max(0, int(new_cases * np.random.uniform(0.01, 0.03)))
-            
-            # Hospitalization data (key new feature)
-            hosp_patients = max(0, int(new_cases * np.random.uniform(0.05, 0.15)))
-            icu_patients = max(0, int(hosp_patients * np.random.uniform(0.1, 0.3)))
-            
-            # Vaccination data (starts from 2021)
-            if current_date >= pd.Timestamp('2021-01-01'):
-                days_since_vacc = (current_date - pd.Timestamp('2021-01-01')).days
-                total_vaccinations = min(
-                    int(country_population * min(days_since_vacc / 365 * 1.8, 2.0)),
-                    country_population * 2
-                )
-                people_vaccinated = min(total_vaccinations, country_population)
-                people_fully_vaccinated = max(0, total_vaccinations - country_population)
-            else:
-                total_vaccinations = 0
-                people_vaccinated = 0
-                people_fully_vaccinated = 0
-            
-            all_data.append({
-                'iso_code': iso_codes[i],
-                'continent': continents[i],
-                'location': country,
-                'date': current_date,
-                'total_cases': total_cases,
-                'new_cases': new_cases,
-                'total_deaths': total_deaths,
-                'new_deaths': new_deaths,
-                'hosp_patients': hosp_patients,  # New field
-                'icu_patients': icu_patients,    # New field
-                'total_vaccinations': total_vaccinations,
-                'people_vaccinated': people_vaccinated,
-                'people_fully_vaccinated': people_fully_vaccinated,
-                'population': country_population
-            })
-    
-    df = pd.DataFrame(all_data)
+    # Synthesize every metric as a (countries, days) array so all the math
+    # runs inside NumPy's C kernels - no Python loop over the ~29k rows.
+    n_countries = len(countries)
+    n_days = len(date_range)
+
+    populations = rng.integers(10_000_000, 350_000_000, size=n_countries)
+
+    # Simulate realistic COVID progression with waves (capped linear growth
+    # plus layered sine waves); JIT-compiled and parallelized when numba is
+    # installed, plain vectorized NumPy otherwise
+    daily_step = rng.integers(50, 500, size=(n_countries, n_days))
+    total_cases = _synthesize_total_cases(daily_step, populations)
+
+    # Calculate other metrics based on total cases
+    total_deaths = (total_cases * rng.uniform(0.01, 0.05, size=(n_countries, n_days))).astype(np.int64)
+    new_cases = (total_cases * rng.uniform(0.001, 0.02, size=(n_countries, n_days))).astype(np.int64)
+    new_deaths = (new_cases * rng.uniform(0.01, 0.03, size=(n_countries, n_days))).astype(np.int64)
+
+    # Hospitalization data (key new feature)
+    hosp_patients = (new_cases * rng.uniform(0.05, 0.15, size=(n_countries, n_days))).astype(np.int64)
+    icu_patients = (hosp_patients * rng.uniform(0.1, 0.3, size=(n_countries, n_days))).astype(np.int64)
+
+    # Vaccination data (starts from 2021); progress is clipped to zero before
+    # the rollout date, so no per-day branching is needed
+    days_since_vacc = (date_range - pd.Timestamp('2021-01-01')).days.values
+    vacc_progress = np.clip(days_since_vacc / 365 * 1.8, 0.0, 2.0)
+    total_vaccinations = np.minimum(
+        (populations[:, None] * vacc_progress).astype(np.int64),
+        populations[:, None] * 2
+    )
+    people_vaccinated = np.minimum(total_vaccinations, populations[:, None])
+    people_fully_vaccinated = np.maximum(0, total_vaccinations - populations[:, None])
+
+    # Flatten the (countries, days) grids into one tidy frame. The date
+    # column is a single tiled datetime64[ns] array - 8 bytes per row and
+    # AVX-friendly int64 comparisons downstream - instead of ~29k boxed
+    # Timestamp objects; the string columns are dictionary-encoded from the
+    # start.
+    df = pd.DataFrame({
+        'iso_code': pd.Categorical(np.repeat(iso_codes, n_days)),
+        'continent': pd.Categorical(np.repeat(continents, n_days)),
+        'location': pd.Categorical(np.repeat(countries, n_days)),
+        'date': np.tile(date_range.values, n_countries),
+        'total_cases': total_cases.ravel(),
+        'new_cases': new_cases.ravel(),
+        'total_deaths': total_deaths.ravel(),
+        'new_deaths': new_deaths.ravel(),
+        'hosp_patients': hosp_patients.ravel(),  # New field
+        'icu_patients': icu_patients.ravel(),    # New field
+        'total_vaccinations': total_vaccinations.ravel(),
+        'people_vaccinated': people_vaccinated.ravel(),
+        'people_fully_vaccinated': people_fully_vaccinated.ravel(),
+        'population': np.repeat(populations, n_days)
+    })
     
     # Calculate derived metrics
-    df['case_fatality_rate'] = (df['total_deaths'] / df['total_cases'].replace(0, np.nan)) * 100
-    df['vaccination_rate'] = (df['people_fully_vaccinated'] / df['population']) * 100
-    df['hospitalization_rate'] = (df['hosp_patients'] / df['new_cases'].replace(0, np.nan)) * 100
-    df['icu_rate'] = (df['icu_patients'] / df['hosp_patients'].replace(0, np.nan)) * 100
-    
+    df['case_fatality_rate'] = _safe_ratio(df['total_deaths'].to_numpy(),
+                                           df['total_cases'].to_numpy())
+    df['vaccination_rate'] = _safe_ratio(df['people_fully_vaccinated'].to_numpy(),
+                                         df['population'].to_numpy())
+    df['hospitalization_rate'] = _safe_ratio(df['hosp_patients'].to_numpy(),
+                                             df['new_cases'].to_numpy())
+    df['icu_rate'] = _safe_ratio(df['icu_patients'].to_numpy(),
+                                 df['hosp_patients'].to_numpy())
+
+    # Shrink in-memory footprint: 32-bit numerics are plenty for these value
+    # ranges (the rate columns come out of _safe_ratio as float32 and the
+    # string columns are categorical from construction). Roughly halves the
+    # RAM the cached frame occupies.
+    for column in ['total_cases', 'new_cases', 'total_deaths', 'new_deaths',
+                   'hosp_patients', 'icu_patients', 'total_vaccinations',
+                   'people_vaccinated', 'people_fully_vaccinated', 'population']:
+        df[column] = df[column].astype('int32')
+
+    # Sort by (location, date) once here; filtering preserves row order, so
+    # no downstream consumer ever needs to re-sort
+    df = df.sort_values(['location', 'date'], kind='mergesort').reset_index(drop=True)
+
     return df
 
+@st.cache_resource
+def load_covid_lazyframe():
+    """
+    Expose the master dataset as a Polars LazyFrame.
+    Filtering and rolling-window work runs in Polars' multithreaded Rust
+    engine; results are converted back to pandas only at the plot boundary.
+    """
+    return pl.from_pandas(load_covid_data()).lazy()
+
 @st.cache_data
 def get_country_list(df):
     """Get sorted list of available countries for the selector."""
-    return sorted(df['location'].unique())
+    # location is categorical, so the (already sorted) category index is
+    # precomputed - no full-column scan-and-hash like unique() would do
+    return df['location'].cat.categories.tolist()
 
 @st.cache_data
 def get_date_range(df):
@@ -266,59 +374,99 @@ def create_sidebar_controls(df):
         'log_scale': log_scale
     }
 
+@st.cache_data(max_entries=32, ttl="15m")
+def _filter_core(countries, start_date, end_date, show_moving_average):
+    """
+    Filter + rolling-average pipeline, cached per unique selection.
+
+    The country/date filter and the rolling averages are expressed as one
+    lazy Polars query, collected in a single multithreaded pass and
+    converted to pandas only for the Plotly layer. Caching on the selection
+    key means unrelated widget toggles (log scale, per-capita) reuse the
+    previous result instead of re-filtering.
+    """
+    query = load_covid_lazyframe().filter(pl.col('location').is_in(list(countries)))
+
+    # Filter by date range
+    if start_date is not None:
+        query = query.filter(
+            pl.col('date').is_between(pd.Timestamp(start_date),
+                                      pd.Timestamp(end_date))
+        )
+
+    query = query.sort(['location', 'date'])
+
+    # Apply moving averages if requested - rolling_mean().over() runs once
+    # per column across all countries, no per-country Python iteration
+    if show_moving_average:
+        query = query.with_columns([
+            pl.col('new_cases').rolling_mean(window_size=7, min_periods=1)
+              .over('location').alias('new_cases_ma'),
+            pl.col('new_deaths').rolling_mean(window_size=7, min_periods=1)
+              .over('location').alias('new_deaths_ma'),
+        ])
+
+    return query.collect().to_pandas()
+
 def filter_data(df, controls):
     """
     Filter the dataset based on user selections.
     This is where we apply all the user's choices to the data.
+
+    Canonicalizes the selection into a hashable cache key (sorted country
+    tuple + date bounds + MA flag) and delegates to the cached _filter_core.
     """
-    # Start with the full dataset
-    filtered_df = df.copy()
-    
-    # Filter by countries
     if controls['countries']:
-        filtered_df = filtered_df[filtered_df['location'].isin(controls['countries'])]
+        countries = tuple(sorted(controls['countries']))
     else:
         # If no countries selected, show a warning and use default
         st.warning("⚠️ No countries selected. Showing data for United States.")
-        filtered_df = filtered_df[filtered_df['location'] == 'United States']
-    
-    # Filter by date range
+        countries = ('United States',)
+
     if len(controls['date_range']) == 2:
         start_date, end_date = controls['date_range']
-        filtered_df = filtered_df[
-            (filtered_df['date'] >= pd.Timestamp(start_date)) & 
-            (filtered_df['date'] <= pd.Timestamp(end_date))
-        ]
-    
-    # Apply moving averages if requested
-    if controls['show_moving_average']:
-        for country in filtered_df['location'].unique():
-            country_mask = filtered_df['location'] == country
-            filtered_df.loc[country_mask, 'new_cases_ma'] = (
-                filtered_df.loc[country_mask, 'new_cases'].rolling(window=7, min_periods=1).mean()
-            )
-            filtered_df.loc[country_mask, 'new_deaths_ma'] = (
-                filtered_df.loc[country_mask, 'new_deaths'].rolling(window=7, min_periods=1).mean()
-            )
-    
-    return filtered_df
+    else:
+        start_date = end_date = None
+
+    return _filter_core(countries, start_date, end_date,
+                        controls['show_moving_average'])
 
 # =============================================================================
 # VISUALIZATION FUNCTIONS
 # =============================================================================
 
+def _downsample(x, y, target=600):
+    """
+    Stride-downsample a single trace to roughly `target` points.
+    Figure JSON size and browser render time scale with point count, and at
+    typical display widths anything beyond a few hundred points per trace
+    adds payload without adding visible detail.
+    """
+    n = len(x)
+    if n <= target:
+        return x, y
+    step = n // target
+    return x.iloc[::step], y.iloc[::step]
+
 def create_summary_metrics(df):
     """
     Create key performance indicator cards at the top of the dashboard.
     These provide immediate insights at a glance.
     """
-    # Calculate summary statistics
-    latest_data = df.groupby('location').last()
-    
-    total_cases = latest_data['total_cases'].sum()
-    total_deaths = latest_data['total_deaths'].sum()
-    avg_vaccination = latest_data['vaccination_rate'].mean()
-    countries_analyzed = len(latest_data)
+    # Calculate summary statistics - filter_data returns the frame sorted by
+    # (location, date), so the latest row per country is simply tail(1); this
+    # skips the column-wise aggregation a groupby().last() would run
+    latest_data = df.groupby('location', sort=False, observed=True).tail(1)
+
+    # Run the scalar reductions through Arrow's SIMD compute kernels rather
+    # than pandas' Series dispatch - negligible on the handful of latest
+    # rows today, but already sized for a real OWID-scale feed
+    latest_table = pa.Table.from_pandas(latest_data, preserve_index=False)
+    total_cases = pc.sum(latest_table['total_cases']).as_py()
+    total_deaths = pc.sum(latest_table['total_deaths']).as_py()
+    total_new_cases = pc.sum(latest_table['new_cases']).as_py()
+    avg_vaccination = pc.mean(latest_table['vaccination_rate']).as_py()
+    countries_analyzed = latest_table.num_rows
     
     # Create four columns for metrics
     col1, col2, col3, col4 = st.columns(4)
@@ -327,7 +475,7 @@ def create_summary_metrics(df):
         st.metric(
             label="Total Cases",
             value=f"{total_cases:,}",
-            delta=f"{latest_data['new_cases'].sum():,} new"
+            delta=f"{total_new_cases:,} new"
         )
     
     with col2:
@@ -354,90 +502,54 @@ def create_summary_metrics(df):
 def create_cases_visualization(df, controls):
     """
     Create visualizations focused on cases and deaths.
-    This demonstrates how to build complex, interactive charts with Plotly.
+    All per-country, per-metric traces are produced by one px.line call
+    over a melted (tidy) frame - a single vectorized figure construction
+    instead of four add_trace calls per country.
     """
     st.subheader("📈 Cases and Deaths Analysis")
-    
-    # Create subplot with secondary y-axis for deaths
-    fig = make_subplots(
-        rows=2, cols=2,
-        subplot_titles=(
-            'Total Cases Over Time', 'Daily New Cases',
-            'Total Deaths Over Time', 'Case Fatality Rate'
-        ),
-        specs=[[{"secondary_y": False}, {"secondary_y": False}],
-               [{"secondary_y": False}, {"secondary_y": False}]]
+
+    # New cases use the 7-day average when enabled
+    if controls['show_moving_average'] and 'new_cases_ma' in df.columns:
+        new_cases_col = 'new_cases_ma'
+        new_cases_title = 'Daily New Cases (7-day avg)'
+    else:
+        new_cases_col = 'new_cases'
+        new_cases_title = 'Daily New Cases'
+
+    metric_titles = {
+        'total_cases': 'Total Cases Over Time',
+        new_cases_col: new_cases_title,
+        'total_deaths': 'Total Deaths Over Time',
+        'case_fatality_rate': 'Case Fatality Rate',
+    }
+
+    # Keep the figure payload bounded on long date ranges (cf. _downsample);
+    # every country spans the same dates, so one stride fits all groups
+    rows_per_country = int(df.groupby('location', observed=True).size().max())
+    if rows_per_country > 600:
+        step = rows_per_country // 600
+        df = df[df.groupby('location', observed=True).cumcount() % step == 0]
+
+    long_df = df.melt(
+        id_vars=['date', 'location'],
+        value_vars=list(metric_titles),
+        var_name='metric', value_name='value'
     )
-    
-    colors = px.colors.qualitative.Set1
-    
-    for i, country in enumerate(df['location'].unique()):
-        country_data = df[df['location'] == country].sort_values('date')
-        color = colors[i % len(colors)]
-        
-        # Total cases
-        fig.add_trace(
-            go.Scatter(
-                x=country_data['date'],
-                y=country_data['total_cases'],
-                name=f"{country} - Cases",
-                line=dict(color=color, width=2),
-                hovertemplate=f"<b>{country}</b><br>" +
-                             "Date: %{x}<br>" +
-                             "Total Cases: %{y:,}<extra></extra>"
-            ),
-            row=1, col=1
-        )
-        
-        # New cases (with moving average if enabled)
-        if controls['show_moving_average'] and 'new_cases_ma' in country_data.columns:
-            y_data = country_data['new_cases_ma']
-            name_suffix = " (7-day avg)"
-        else:
-            y_data = country_data['new_cases']
-            name_suffix = ""
-        
-        fig.add_trace(
-            go.Scatter(
-                x=country_data['date'],
-                y=y_data,
-                name=f"{country} - New{name_suffix}",
-                line=dict(color=color, width=2, dash='dot'),
-                hovertemplate=f"<b>{country}</b><br>" +
-                             "Date: %{x}<br>" +
-                             f"New Cases{name_suffix}: %{{y:,.0f}}<extra></extra>"
-            ),
-            row=1, col=2
-        )
-        
-        # Total deaths
-        fig.add_trace(
-            go.Scatter(
-                x=country_data['date'],
-                y=country_data['total_deaths'],
-                name=f"{country} - Deaths",
-                line=dict(color=color, width=2, dash='dash'),
-                hovertemplate=f"<b>{country}</b><br>" +
-                             "Date: %{x}<br>" +
-                             "Total Deaths: %{y:,}<extra></extra>"
-            ),
-            row=2, col=1
-        )
-        
-        # Case fatality rate
-        fig.add_trace(
-            go.Scatter(
-                x=country_data['date'],
-                y=country_data['case_fatality_rate'],
-                name=f"{country} - CFR",
-                line=dict(color=color, width=2, dash='dashdot'),
-                hovertemplate=f"<b>{country}</b><br>" +
-                             "Date: %{x}<br>" +
-                             "Case Fatality Rate: %{y:.2f}%<extra></extra>"
-            ),
-            row=2, col=2
-        )
-    
+    long_df['metric'] = long_df['metric'].map(metric_titles)
+
+    fig = px.line(
+        long_df, x='date', y='value', color='location',
+        facet_col='metric', facet_col_wrap=2,
+        category_orders={'metric': list(metric_titles.values())},
+        log_y=controls['log_scale'],
+        render_mode='webgl',
+        labels={'date': 'Date', 'value': '', 'location': 'Country'}
+    )
+
+    # Each metric lives on its own scale; strip the "metric=" facet prefix
+    fig.update_yaxes(matches=None, showticklabels=True)
+    fig.for_each_annotation(lambda a: a.update(text=a.text.split('=')[-1]))
+
     # Update layout for professional appearance
     fig.update_layout(
         height=800,
@@ -446,12 +558,7 @@ def create_cases_visualization(df, controls):
         title_x=0.5,
         hovermode='x unified'
     )
-    
-    # Apply log scale if requested
-    if controls['log_scale']:
-        fig.update_yaxes(type="log", row=1, col=1)
-        fig.update_yaxes(type="log", row=2, col=1)
-    
+
     st.plotly_chart(fig, use_container_width=True)
 
 def create_hospitalization_visualization(df, controls):
@@ -476,19 +583,24 @@ def create_hospitalization_visualization(df, controls):
     )
     
     colors = px.colors.qualitative.Set2
-    
-    for i, country in enumerate(df['location'].unique()):
-        country_data = df[df['location'] == country].sort_values('date')
+
+    # The frame arrives sorted by (location, date); iterating the groupby
+    # hands out ready-made per-country slices without per-country boolean
+    # mask scans or re-sorting
+    for i, (country, country_data) in enumerate(
+            df.groupby('location', sort=False, observed=True)):
         color = colors[i % len(colors)]
         
         # Hospital patients
+        x_hosp, y_hosp = _downsample(country_data['date'], country_data['hosp_patients'])
         fig.add_trace(
-            go.Scatter(
-                x=country_data['date'],
-                y=country_data['hosp_patients'],
+            go.Scattergl(
+                x=x_hosp,
+                y=y_hosp,
                 name=f"{country} - Hospital",
                 line=dict(color=color, width=3),
-                hovertemplate=f"<b>{country}</b><br>" +
+                customdata=np.repeat(country, len(x_hosp)),
+                hovertemplate="<b>%{customdata}</b><br>" +
                              "Date: %{x}<br>" +
                              "Hospital Patients: %{y:,}<extra></extra>"
             ),
@@ -496,13 +608,15 @@ def create_hospitalization_visualization(df, controls):
         )
         
         # ICU patients
+        x_icu, y_icu = _downsample(country_data['date'], country_data['icu_patients'])
         fig.add_trace(
-            go.Scatter(
-                x=country_data['date'],
-                y=country_data['icu_patients'],
+            go.Scattergl(
+                x=x_icu,
+                y=y_icu,
                 name=f"{country} - ICU",
                 line=dict(color=color, width=3, dash='dot'),
-                hovertemplate=f"<b>{country}</b><br>" +
+                customdata=np.repeat(country, len(x_icu)),
+                hovertemplate="<b>%{customdata}</b><br>" +
                              "Date: %{x}<br>" +
                              "ICU Patients: %{y:,}<extra></extra>"
             ),
@@ -510,13 +624,15 @@ def create_hospitalization_visualization(df, controls):
         )
         
         # Hospitalization rate
+        x_hr, y_hr = _downsample(country_data['date'], country_data['hospitalization_rate'])
         fig.add_trace(
-            go.Scatter(
-                x=country_data['date'],
-                y=country_data['hospitalization_rate'],
+            go.Scattergl(
+                x=x_hr,
+                y=y_hr,
                 name=f"{country} - Hosp Rate",
                 line=dict(color=color, width=2),
-                hovertemplate=f"<b>{country}</b><br>" +
+                customdata=np.repeat(country, len(x_hr)),
+                hovertemplate="<b>%{customdata}</b><br>" +
                              "Date: %{x}<br>" +
                              "Hospitalization Rate: %{y:.1f}%<extra></extra>"
             ),
@@ -524,13 +640,15 @@ def create_hospitalization_visualization(df, controls):
         )
         
         # ICU rate
+        x_ir, y_ir = _downsample(country_data['date'], country_data['icu_rate'])
         fig.add_trace(
-            go.Scatter(
-                x=country_data['date'],
-                y=country_data['icu_rate'],
+            go.Scattergl(
+                x=x_ir,
+                y=y_ir,
                 name=f"{country} - ICU Rate",
                 line=dict(color=color, width=2, dash='dash'),
-                hovertemplate=f"<b>{country}</b><br>" +
+                customdata=np.repeat(country, len(x_ir)),
+                hovertemplate="<b>%{customdata}</b><br>" +
                              "Date: %{x}<br>" +
                              "ICU Rate: %{y:.1f}%<extra></extra>"
             ),
@@ -584,9 +702,11 @@ def create_vaccination_visualization(df, controls):
     )
     
     colors = px.colors.qualitative.Pastel
-    
-    for i, country in enumerate(vacc_data['location'].unique()):
-        country_data = vacc_data[vacc_data['location'] == country].sort_values('date')
+
+    # Same pattern as the hospitalization view: the frame is already sorted,
+    # so the groupby yields per-country slices with no masking or sorting
+    for i, (country, country_data) in enumerate(
+            vacc_data.groupby('location', sort=False, observed=True)):
         color = colors[i % len(colors)]
         
         # Total vaccinations
@@ -596,14 +716,16 @@ def create_vaccination_visualization(df, controls):
         else:
             y_data = country_data['total_vaccinations']
             y_title = "Total vaccinations"
-        
+
+        x_vacc, y_vacc = _downsample(country_data['date'], y_data)
         fig.add_trace(
-            go.Scatter(
-                x=country_data['date'],
-                y=y_data,
+            go.Scattergl(
+                x=x_vacc,
+                y=y_vacc,
                 name=f"{country}",
                 line=dict(color=color, width=3),
-                hovertemplate=f"<b>{country}</b><br>" +
+                customdata=np.repeat(country, len(x_vacc)),
+                hovertemplate="<b>%{customdata}</b><br>" +
                              "Date: %{x}<br>" +
                              f"{y_title}: %{{y:,.1f}}<extra></extra>"
             ),
@@ -611,13 +733,15 @@ def create_vaccination_visualization(df, controls):
         )
         
         # Vaccination coverage
+        x_cov, y_cov = _downsample(country_data['date'], country_data['vaccination_rate'])
         fig.add_trace(
-            go.Scatter(
-                x=country_data['date'],
-                y=country_data['vaccination_rate'],
+            go.Scattergl(
+                x=x_cov,
+                y=y_cov,
                 name=f"{country} - Coverage",
                 line=dict(color=color, width=2, dash='dot'),
-                hovertemplate=f"<b>{country}</b><br>" +
+                customdata=np.repeat(country, len(x_cov)),
+                hovertemplate="<b>%{customdata}</b><br>" +
                              "Date: %{x}<br>" +
                              "Fully Vaccinated: %{y:.1f}%<extra></extra>"
             ),
@@ -656,7 +780,7 @@ def main():
         return
     
     # Success message with data info
-    st.success(f"✅ Data loaded successfully! Analyzing {df['location'].nunique()} countries from {df['date'].min().date()} to {df['date'].max().date()}")
+    st.success(f"✅ Data loaded successfully! Analyzing {len(df['location'].cat.categories)} countries from {df['date'].min().date()} to {df['date'].max().date()}")
     
     # Create sidebar controls
     controls = create_sidebar_controls(df)
@@ -703,20 +827,27 @@ def main():
     with st.expander("📥 Export Data"):
         st.markdown("Download the filtered dataset for your own analysis:")
         
-        # Prepare export data
-        export_df = filtered_df.copy()
-        export_df['date'] = export_df['date'].dt.strftime('%Y-%m-%d')
-        
-        csv = export_df.to_csv(index=False)
-        
+        # Stream the CSV through Arrow's multithreaded C++ writer instead of
+        # pandas' Python-level to_csv. Casting the date column to date32
+        # keeps the YYYY-MM-DD formatting without a strftime pre-pass.
+        export_table = pa.Table.from_pandas(filtered_df, preserve_index=False)
+        date_index = export_table.schema.get_field_index('date')
+        export_table = export_table.set_column(
+            date_index, 'date', export_table['date'].cast(pa.date32())
+        )
+
+        buffer = io.BytesIO()
+        pacsv.write_csv(export_table, buffer)
+        csv = buffer.getvalue()
+
         st.download_button(
             label="Download CSV",
             data=csv,
             file_name=f"covid_data_{datetime.now().strftime('%Y%m%d')}.csv",
             mime="text/csv"
         )
-        
-        st.info(f"Dataset contains {len(export_df):,} rows and {len(export_df.columns)} columns")
+
+        st.info(f"Dataset contains {export_table.num_rows:,} rows and {export_table.num_columns} columns")
 
 # =============================================================================
 # APPLICATION ENTRY POINT
@@ -740,6 +871,8 @@ DEPLOYMENT INSTRUCTIONS:
    plotly>=5.15.0
    pandas>=2.0.0
    numpy>=1.24.0
+   pyarrow>=12.0.0
+   polars>=0.20.0
 
 3. Run locally:
    streamlit run covid_dashboard.py